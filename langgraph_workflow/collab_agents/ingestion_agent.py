@@ -1,6 +1,6 @@
 from langgraph_agents.langgraph_system import BaseAgent
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from datetime import datetime
 import re
 import json
@@ -16,6 +16,8 @@ class IngestionInput(BaseModel):
 
 class NormalizedPayload(BaseModel):
     """Schema for the standardized output"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     raw_input: str
     cleaned_text: str
     ingestion_timestamp: str
@@ -67,8 +69,8 @@ class IngestionAgent(BaseAgent):
             # 2. Cleaning & Normalization
             cleaned_text = self._clean_text(validated_input.user_input)
             
-            # 3. Enrichment
-            normalized_output = NormalizedPayload(
+            # 3. Enrichment (fields come from the validated input, so skip re-validation)
+            normalized_output = NormalizedPayload.model_construct(
                 raw_input=validated_input.user_input,
                 cleaned_text=cleaned_text,
                 ingestion_timestamp=datetime.utcnow().isoformat() + "Z",
@@ -91,17 +91,19 @@ class IntentAgent(BaseAgent):
         # If unsafe, return immediately without LLM call
         if not is_safe:
             from models.model_intent_agent import IntentClassification
-            unsafe_result = IntentClassification(
+            unsafe_result = IntentClassification.model_construct(
                 primary_intent="safety_violation",
                 confidence_score=1.0,
                 urgency_level="critical",
                 sla_risk_score=1.0,
+                secondary_intents=[],
                 reasoning=safety_violation
             )
-            await self.state_store.set("intent_classification", unsafe_result.model_dump())
+            unsafe_dict = unsafe_result.model_dump()
+            await self.state_store.set("intent_classification", unsafe_dict)
             return {
                 "status": "blocked",
-                "classification": unsafe_result.model_dump(),
+                "classification": unsafe_dict,
                 "message": "Content violates safety policy"
             }
 
@@ -303,8 +305,9 @@ Return ONLY valid JSON, no additional text."""
             reasoning=reasoning
         )
         
-        # Save to state store for downstream agents
-        await self.state_store.set("intent_classification", intent_classification.model_dump())
+        # Save to state store for downstream agents (serialized once, shared with the return value)
+        classification_dict = intent_classification.model_dump()
+        await self.state_store.set("intent_classification", classification_dict)
         
         self.logger.info(f"Intent classification complete and saved to state store")
         self.logger.info(f"Final result: intent={primary_intent}, urgency={urgency}, sla_risk={sla_risk_score:.2f}, confidence={confidence_score:.2f}")
@@ -312,6 +315,6 @@ Return ONLY valid JSON, no additional text."""
         # Return success with classification details
         return {
             "status": "success",
-            "classification": intent_classification.model_dump(),
+            "classification": classification_dict,
             "message": "Intent classification completed successfully"
         }
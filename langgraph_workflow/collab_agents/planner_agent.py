@@ -157,6 +157,8 @@ class PlannerAgent(BaseAgent):
     def _build_execution_graph(self, template_key: str, strategy: ExecutionStrategy, ingestion_data: Dict[str, Any]) -> ExecutionPlan:
         """
         Constructs the list of WorkflowSteps based on the registry template and selected strategy.
+        Steps are built from trusted registry/template data, so models are created with
+        model_construct (no validation pass).
         """
         template = self.registry.get("workflow_templates", {}).get(template_key, {})
         agent_list = template.get("typical_agents", [])
@@ -176,7 +178,7 @@ class PlannerAgent(BaseAgent):
             
             for agent_name in remaining_agents:
                 step_id = f"step_{agent_name}"
-                step = WorkflowStep(
+                step = WorkflowStep.model_construct(
                     step_id=step_id,
                     agent_name=agent_name,
                     description=f"Execute {agent_name}",
@@ -203,7 +205,7 @@ class PlannerAgent(BaseAgent):
             parallel_step_ids = []
             for agent_name in parallel_group:
                 step_id = f"step_{agent_name}"
-                step = WorkflowStep(
+                step = WorkflowStep.model_construct(
                     step_id=step_id,
                     agent_name=agent_name,
                     description=f"Parallel execution of {agent_name}",
@@ -217,7 +219,7 @@ class PlannerAgent(BaseAgent):
             previous_deps = parallel_step_ids
             for agent_name in serial_group:
                 step_id = f"step_{agent_name}"
-                step = WorkflowStep(
+                step = WorkflowStep.model_construct(
                     step_id=step_id,
                     agent_name=agent_name,
                     description=f"Execute {agent_name}",
@@ -230,7 +232,7 @@ class PlannerAgent(BaseAgent):
              # Logic for advanced branching goes here
              return self._build_execution_graph(template_key, ExecutionStrategy.SERIAL, intent)
 
-        return ExecutionPlan(
+        return ExecutionPlan.model_construct(
             plan_id=f"plan_{template_key}_{strategy.value}",
             strategy=strategy.value,
             steps=steps
@@ -241,14 +243,14 @@ class PlannerAgent(BaseAgent):
         self.logger.error("Creating Fallback Plan due to error.")
         
         # Fallback: Just try to synthesize a response directly (maybe asking for more info)
-        fallback_step = WorkflowStep(
+        fallback_step = WorkflowStep.model_construct(
             step_id="step_response_synthesis",
             agent_name="response_synthesis_agent",
             description="Fallback synthesis",
             dependencies=[]
         )
         
-        plan = ExecutionPlan(
+        plan = ExecutionPlan.model_construct(
             plan_id="fallback_plan",
             strategy="serial",
             steps=[fallback_step]
@@ -117,14 +117,15 @@ class ReasoningAgent(BaseAgent):
             confidence_score=correlation_result.get("confidence_score", 0.5)
         )
         
-        # Save to state store
-        await self.state_store.set("reasoning_trace", reasoning_trace.model_dump())
+        # Save to state store (serialized once, shared with the return value)
+        trace_dict = reasoning_trace.model_dump()
+        await self.state_store.set("reasoning_trace", trace_dict)
         
         self.logger.info("Reasoning analysis complete and saved to state store")
         
         return {
             "status": "success",
-            "reasoning_trace": reasoning_trace.model_dump(),
+            "reasoning_trace": trace_dict,
             "message": "Reasoning analysis completed successfully"
         }
     
@@ -1,5 +1,14 @@
 from langgraph_agents.langgraph_system import BaseAgent
 from typing import Dict, Any
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2)
+def _get_embed_model(model_name: str):
+    """Load a SentenceTransformer once per process; loading it dominates a cold retrieval call."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
 
 class RetrievalAgent(BaseAgent):
     """
@@ -21,7 +30,7 @@ class RetrievalAgent(BaseAgent):
         # Lazy imports for heavy libs
         try:
             import chromadb
-            from sentence_transformers import SentenceTransformer
+            import sentence_transformers  # noqa: F401  (probe only; the model comes from _get_embed_model)
         except Exception as e:
             return {"status": "failed", "error": f"Missing dependency: {e}"}
 
@@ -53,8 +62,8 @@ class RetrievalAgent(BaseAgent):
         if not query_text:
             return {"status": "failed", "error": "No user input found for retrieval"}
 
-        # Initialize embedding model
-        embed_model = SentenceTransformer("all-MiniLM-L6-v2")
+        # Initialize embedding model (shared across executions)
+        embed_model = _get_embed_model("all-MiniLM-L6-v2")
 
         # Initialize chroma client and collection
         client = chromadb.Client()
@@ -76,8 +85,9 @@ class RetrievalAgent(BaseAgent):
                             ids.append(obj.get("id"))
                             docs.append(obj.get("document"))
                             metas.append(obj.get("metadata"))
-                    for d in docs:
-                        embs.append(embed_model.encode(d).tolist())
+                    if docs:
+                        # One batched encode call instead of one forward pass per document
+                        embs = embed_model.encode(docs).tolist()
                     if ids:
                         collection.add(ids=ids, documents=docs, metadatas=metas, embeddings=embs)
                 except Exception:
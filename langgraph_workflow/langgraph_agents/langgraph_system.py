@@ -89,6 +89,9 @@ class StateStore:
     def has_key(self, key: str) -> bool:
         return key in self.data
         
+    def keys(self) -> List[str]:
+        return list(self.data)
+        
     def get_all(self) -> Dict[str, Any]:
         return self.data.copy()
 
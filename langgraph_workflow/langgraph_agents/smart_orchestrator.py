@@ -4,13 +4,15 @@ Uses LLM to analyze prompts and select optimal agents
 """
 import json
 import asyncio
+import hashlib
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
 try:
     from .langgraph_system import EventBus, StateStore, WorkflowMonitor, EventType, AgentEvent
-    from ..llm_client import LLMClient
+    from ..llm_client import LLMClient, JSON_FENCE_RE
     from ..utils.CommonLogger import CommonLogger
     from ..config import UTILS_LOG_DIR_PATH
 except ImportError:
@@ -19,11 +21,41 @@ except ImportError:
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from langgraph_agents.langgraph_system import EventBus, StateStore, WorkflowMonitor, EventType, AgentEvent
-    from llm_client import LLMClient
+    from llm_client import LLMClient, JSON_FENCE_RE
     from utils.CommonLogger import CommonLogger
     from config import UTILS_LOG_DIR_PATH
 
-@dataclass
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+# Lifecycle events that are always written; anything else is only logged in debug mode
+_ALWAYS_LOG = frozenset({
+    "input_received",
+    "plan_created",
+    "plan_failed",
+    "plan_presented",
+    "plan_approved",
+    "state_initialized",
+    "agent_start",
+    "agent_complete",
+    "workflow_complete",
+    "workflow_failed",
+    "workflow_cancelled",
+})
+
+# Events whose (potentially multi-KB) payload field is replaced by a summary outside debug mode
+_SUMMARIZED_FIELDS = {
+    "state_initialized": "user_input",
+    "agent_complete": "output",
+}
+
+@dataclass(slots=True, frozen=True)
 class WorkflowPlan:
     selected_agents: List[str]
     execution_order: List[str]
@@ -31,6 +63,51 @@ class WorkflowPlan:
     reasoning: str
     estimated_time: str
     estimated_cost: str
+    # Execution levels derived from dependencies once at construction (agents within a level are independent)
+    levels: Tuple[Tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "levels", self._compute_levels())
+
+    def _compute_levels(self) -> Tuple[Tuple[str, ...], ...]:
+        """Group execution_order into dependency levels using Kahn's algorithm"""
+        order = list(dict.fromkeys(self.execution_order))
+        position = {agent: i for i, agent in enumerate(order)}
+        # Only dependencies on agents that are part of this plan constrain the order
+        deps = {
+            agent: {d for d in self.dependencies.get(agent, []) if d in position and d != agent}
+            for agent in order
+        }
+        dependents: Dict[str, List[str]] = {agent: [] for agent in order}
+        for agent, agent_deps in deps.items():
+            for dep in agent_deps:
+                dependents[dep].append(agent)
+        in_degree = {agent: len(agent_deps) for agent, agent_deps in deps.items()}
+        
+        levels = []
+        current = [agent for agent in order if in_degree[agent] == 0]
+        while current:
+            levels.append(tuple(current))
+            ready = []
+            for agent in current:
+                for dependent in dependents[agent]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        ready.append(dependent)
+            current = sorted(ready, key=position.__getitem__)
+        
+        # Agents caught in a dependency cycle run last, in their planned order
+        scheduled = {agent for level in levels for agent in level}
+        remaining = tuple(agent for agent in order if agent not in scheduled)
+        if remaining:
+            levels.append(remaining)
+        return tuple(levels)
+
+@lru_cache(maxsize=None)
+def _load_registry(registry_path: str) -> Dict[str, Any]:
+    """Read and parse a registry file once per process (the registry is treated as read-only)"""
+    with open(registry_path, 'r') as f:
+        return json.load(f)
 
 class AgentRegistry:
     """Manages agent definitions and capabilities"""
@@ -38,10 +115,8 @@ class AgentRegistry:
     def __init__(self, registry_path: str = None):
         if registry_path is None:
             # Default to agent_registry.json in the same directory as this file
-            import os
             registry_path = os.path.join(os.path.dirname(__file__), "agent_registry.json")
-        with open(registry_path, 'r') as f:
-            self.registry_data = json.load(f)
+        self.registry_data = _load_registry(os.path.abspath(registry_path))
             
     def get_all_agents(self) -> Dict[str, Any]:
         return self.registry_data["agents"]
@@ -69,16 +144,37 @@ class SmartOrchestrator:
         self.monitor = WorkflowMonitor(self.event_bus)
         self.registry = AgentRegistry()
         self.llm = LLMClient(agent_type="content_generator", debug=debug)
+        # Agent instances built speculatively while a plan awaits approval, keyed by id(plan)
+        self._prewarmed: Dict[int, asyncio.Task] = {}
+        # Fire-and-forget tasks (connection warm-up); the loop only holds weak references to tasks
+        self._background: Set[asyncio.Task] = set()
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         self.log_path = os.path.join(UTILS_LOG_DIR_PATH, f"smart_orchestrator_{timestamp}.jsonl")
 
     def _log_event(self, event_type: str, payload: Dict[str, Any]) -> None:
+        if not self.debug:
+            if event_type not in _ALWAYS_LOG:
+                return
+            field_name = _SUMMARIZED_FIELDS.get(event_type)
+            if field_name in payload:
+                payload = dict(payload)
+                payload[field_name] = self._summarize_payload(payload[field_name])
         record = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "event_type": event_type,
             "payload": payload
         }
-        CommonLogger.WriteLog(self.log_path, json.dumps(record, ensure_ascii=False))
+        CommonLogger.WriteLog(self.log_path, _dumps(record))
+
+    @staticmethod
+    def _summarize_payload(value: Any) -> Dict[str, Any]:
+        """Compact stand-in for a large payload: size, short hash and a preview"""
+        serialized = _dumps(value)
+        return {
+            "output_size": len(serialized),
+            "output_hash": hashlib.blake2b(serialized[:512].encode("utf-8")).hexdigest()[:16],
+            "output_preview": serialized[:128]
+        }
         
     async def analyze_prompt(self, user_prompt: str) -> WorkflowPlan:
         """Analyze user prompt and create workflow plan"""
@@ -93,7 +189,7 @@ class SmartOrchestrator:
         
         try:
             # Get LLM analysis
-            response = self.llm.generate(analysis_prompt, max_tokens=1500, temperature=0.3)
+            response = self.llm.generate(analysis_prompt, max_tokens=1500, temperature=0.3, json_mode=True)
             
             # Parse response
             workflow_plan = self._parse_workflow_response(response)
@@ -174,13 +270,9 @@ RULES:
     def _parse_workflow_response(self, response: str) -> WorkflowPlan:
         """Parse LLM response into WorkflowPlan"""
         
-        # Clean response
-        cleaned = response.strip()
-        if cleaned.startswith('```json'):
-            cleaned = cleaned[7:]
-        if cleaned.endswith('```'):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
+        # Clean response (JSON mode should make fences rare; kept as a safety net)
+        match = JSON_FENCE_RE.match(response)
+        cleaned = match.group(1) if match else response.strip()
         
         try:
             data = json.loads(cleaned)
@@ -207,7 +299,8 @@ RULES:
         """Ensure all required dependencies from agent_registry.json are included"""
         
         agents_to_add = set()
-        updated_dependencies = dict(plan.dependencies)
+        # Copy the dependency lists: plans are immutable and their levels are computed at construction
+        updated_dependencies = {agent: list(deps) for agent, deps in plan.dependencies.items()}
         
         # For each selected agent, check if its dependencies are included
         for agent_id in plan.selected_agents:
@@ -243,6 +336,16 @@ RULES:
                 estimated_cost=plan.estimated_cost
             )
         
+        if updated_dependencies != plan.dependencies:
+            return WorkflowPlan(
+                selected_agents=plan.selected_agents,
+                execution_order=plan.execution_order,
+                dependencies=updated_dependencies,
+                reasoning=plan.reasoning,
+                estimated_time=plan.estimated_time,
+                estimated_cost=plan.estimated_cost
+            )
+        
         return plan
     
     def _topological_sort(self, agents: List[str], dependencies: Dict[str, List[str]]) -> List[str]:
@@ -296,7 +399,7 @@ RULES:
             estimated_cost="medium"
         )
         
-    def present_plan_to_user(self, plan: WorkflowPlan) -> bool:
+    async def present_plan_to_user(self, plan: WorkflowPlan) -> bool:
         """Present workflow plan to user for approval"""
         self._log_event("plan_presented", {
             "selected_agents": plan.selected_agents,
@@ -325,7 +428,8 @@ RULES:
         print("="*50)
         
         while True:
-            choice = input("Do you approve this workflow plan? (Y/N/D for details): ").strip().lower()
+            # Read stdin on a worker thread so the event loop keeps running while waiting for the user
+            choice = (await asyncio.to_thread(input, "Do you approve this workflow plan? (Y/N/D for details): ")).strip().lower()
             
             if choice == 'y':
                 self._log_event("plan_approved", {"approved": True})
@@ -372,10 +476,11 @@ RULES:
         await self.state_store.set("user_input", user_input)
         self._log_event("state_initialized", {"user_input": user_input})
         
-        # Import and create agent instances
-        agent_instances = {}
-        for agent_id in plan.selected_agents:
-            agent_instances[agent_id] = await self._create_agent_instance(agent_id)
+        # Import and create agent instances (reusing the ones prewarmed during plan approval)
+        agent_instances = await self._take_prewarmed(plan)
+        if agent_instances is None:
+            created = await asyncio.gather(*(self._create_agent_instance(a) for a in plan.selected_agents))
+            agent_instances = dict(zip(plan.selected_agents, created))
             
         # Set up dependencies
         for agent_id, agent in agent_instances.items():
@@ -383,26 +488,23 @@ RULES:
             
         # Execute workflow
         try:
-            # Execute agents in dependency order
-            for agent_id in plan.execution_order:
-                agent = agent_instances[agent_id]
-                
-                # Wait for dependencies to complete first
-                for dep in agent.dependencies:
-                    if dep in agent_instances:
-                        await agent_instances[dep].wait_for_completion()
-                        
-                # Now execute this agent
-                self._log_event("agent_start", {
-                    "agent_id": agent_id,
-                    "input_state": self.state_store.get_all()
-                })
-                await agent.execute_async()
-                output = await self.state_store.get(f"{agent_id}_output")
-                self._log_event("agent_complete", {
-                    "agent_id": agent_id,
-                    "output": output
-                })
+            # Execute agents level by level; every dependency of a level completed in an earlier one
+            for level in plan.levels:
+                for agent_id in level:
+                    agent = agent_instances[agent_id]
+                    start_payload = {
+                        "agent_id": agent_id,
+                        "input_keys": self.state_store.keys()
+                    }
+                    if self.debug:
+                        start_payload["input_state"] = self.state_store.get_all()
+                    self._log_event("agent_start", start_payload)
+                    await agent.execute_async()
+                    output = await self.state_store.get(f"{agent_id}_output")
+                    self._log_event("agent_complete", {
+                        "agent_id": agent_id,
+                        "output": output
+                    })
                 
             # Collect final results
             results = {}
@@ -423,6 +525,44 @@ RULES:
             self._log_event("workflow_failed", {"error": str(e)})
             raise
             
+    async def _prewarm(self, plan: WorkflowPlan) -> Dict[str, Any]:
+        """Import and construct the plan's agents and warm the LLM connection while the user reviews the plan"""
+        # The warm-up is not awaited: a slow HEAD request (up to its timeout) must not hold back the agents
+        warm_connection = asyncio.create_task(asyncio.to_thread(self.llm.warm_connection))
+        self._background.add(warm_connection)
+        warm_connection.add_done_callback(self._finish_background)
+        created = await asyncio.gather(*(self._create_agent_instance(a) for a in plan.selected_agents))
+        return dict(zip(plan.selected_agents, created))
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        # Retrieve the outcome so a failure is not reported as an unretrieved task exception
+        if not task.cancelled():
+            task.exception()
+
+    async def _take_prewarmed(self, plan: WorkflowPlan) -> Optional[Dict[str, Any]]:
+        """Return the prewarmed agent instances for a plan, or None if there are none usable"""
+        task = self._prewarmed.pop(id(plan), None)
+        if task is None:
+            return None
+        try:
+            return await task
+        except Exception as e:
+            if self.debug:
+                print(f"[SmartOrchestrator] Prewarm failed, creating agents on demand: {e}")
+            return None
+
+    def _discard_prewarmed(self, plan: WorkflowPlan) -> None:
+        task = self._prewarmed.pop(id(plan), None)
+        if task is None:
+            return
+        if task.done():
+            # Retrieve the outcome so a failed prewarm is not reported as an unhandled task exception
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
     async def _create_agent_instance(self, agent_id: str):
         """Dynamically create agent instance"""
         
@@ -535,15 +675,20 @@ RULES:
     async def run_intelligent_workflow(self, user_prompt: str) -> Dict[str, Any]:
         """Complete intelligent workflow: analyze -> plan -> confirm -> execute"""
         
+        workflow_plan = None
         try:
             # Step 1: Analyze user prompt
             print("🔍 Analyzing your request...")
             workflow_plan = await self.analyze_prompt(user_prompt)
             
+            # Warm up agents and the LLM connection in the background while the user decides
+            self._prewarmed[id(workflow_plan)] = asyncio.create_task(self._prewarm(workflow_plan))
+            
             # Step 2: Present plan to user
-            approved = self.present_plan_to_user(workflow_plan)
+            approved = await self.present_plan_to_user(workflow_plan)
             
             if not approved:
+                self._discard_prewarmed(workflow_plan)
                 print("❌ Workflow cancelled by user.")
                 self._log_event("workflow_cancelled", {"reason": "user_declined_plan"})
                 return {"status": "cancelled"}
@@ -556,6 +701,8 @@ RULES:
             return {"status": "completed", "results": results}
             
         except Exception as e:
+            if workflow_plan is not None:
+                self._discard_prewarmed(workflow_plan)
             print(f"💥 Workflow failed: {e}")
             self._log_event("workflow_failed", {"error": str(e)})
             return {"status": "failed", "error": str(e)}
\ No newline at end of file
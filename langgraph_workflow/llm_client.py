@@ -13,6 +13,13 @@ except ImportError:
     # Handle case where utils is not in path or circular import
     JsonToToonConverter = None
 
+
+# One HTTP session per process so every client reuses pooled keep-alive (TLS) connections
+_SESSION = requests.Session()
+
+# Matches a response wrapped in a markdown code fence and captures its body (shared with the orchestrator)
+JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+
 class LLMClient:
     def __init__(self, agent_type="default", debug=False):
         self.provider = LLM_PROVIDER
@@ -20,6 +27,7 @@ class LLMClient:
         self.api_url = LLM_API_URL
         self.debug = debug
         self.agent_type = agent_type
+        self.session = _SESSION
         # Select model based on agent type
         from config import LLM_MODELS
         self.model = LLM_MODELS.get(agent_type, LLM_MODELS["default"])
@@ -50,17 +58,14 @@ class LLMClient:
         print(f"[LLM-STATS] ---")
 
     def generate(self, prompt, **kwargs):
-        # Calculate input tokens
-        request_tokens = self._estimate_tokens(prompt)
-        
         if self.provider == "mistral":
             response = self._call_mistral(prompt, **kwargs)
             
-            # Calculate response tokens
-            response_tokens = self._estimate_tokens(response)
-            
-            # Log usage statistics
-            self._log_usage_stats(prompt, response, request_tokens, response_tokens)
+            # Token estimation and usage stats are diagnostics only; skip them outside debug mode
+            if self.debug:
+                request_tokens = self._estimate_tokens(prompt)
+                response_tokens = self._estimate_tokens(response)
+                self._log_usage_stats(prompt, response, request_tokens, response_tokens)
             
             return response
         # Add other providers here
@@ -84,7 +89,7 @@ class LLMClient:
                 return {"raw_response": response}
 
         # 1. Encode Input
-        # Auto-generate mapping on the fly for this payload
+        # Auto-generate mapping on the fly for this payload; fingerprinting it for a cache costs as much as the scan
         mapping = JsonToToonConverter._generate_auto_mapping(input_payload)
         toon_input = JsonToToonConverter.encode(input_payload, mapping=mapping)
         
@@ -115,12 +120,21 @@ class LLMClient:
         # Try JSON decode
         try:
             # Clean potential markdown code blocks
-            clean = response_text.replace("```json", "").replace("```", "").strip()
+            match = JSON_FENCE_RE.match(response_text)
+            clean = match.group(1) if match else response_text.strip()
             return json.loads(clean)
         except:
              # Last ditch: return raw
              return {"raw_response": response_text}
 
+    def warm_connection(self, timeout=5):
+        """Open (and pool) the TLS connection to the provider ahead of the first real call"""
+        try:
+            self.session.head(self.api_url, timeout=timeout)
+        except Exception as e:
+            if self.debug:
+                print("[DEBUG] Connection warm-up failed:", e)
+
     def _call_mistral(self, prompt, **kwargs):
 
         headers = {
@@ -138,9 +152,12 @@ class LLMClient:
         # Add top_p if provided
         if "top_p" in kwargs:
             payload["top_p"] = kwargs["top_p"]
+        # Ask for constrained JSON output (no markdown fences) when requested
+        if kwargs.get("json_mode"):
+            payload["response_format"] = {"type": "json_object"}
         if self.debug:
             print("[DEBUG] Sending payload to Mistral:", payload)
-        response = requests.post(f"{self.api_url}/chat/completions", json=payload, headers=headers)
+        response = self.session.post(f"{self.api_url}/chat/completions", json=payload, headers=headers)
         if self.debug:
             print("[DEBUG] Response status:", response.status_code)
             print("[DEBUG] Response text:", response.text)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 
 class IngestionInput(BaseModel):
@@ -6,6 +6,8 @@ class IngestionInput(BaseModel):
     source_metadata: Optional[Dict[str, Any]] = Field(default=None, description="Metadata about the source (e.g., channel='email', sender='user@example.com', timestamp).")
 
 class NormalizedPayload(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     request_id: str = Field(..., description="Unique ID for this request.")
     cleaned_text: str = Field(..., description="Sanitized and normalized text content.")
     structured_data: Dict[str, Any] = Field(default_factory=dict, description="Any extracted structured data from the raw input.")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from .model_ingestion_agent import NormalizedPayload
 
@@ -6,6 +6,8 @@ class IntentInput(BaseModel):
     normalized_payload: NormalizedPayload
 
 class IntentClassification(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     primary_intent: str = Field(..., description="The main intent detected (e.g., 'technical_support', 'billing').")
     confidence_score: float = Field(..., description="Confidence level of the intent classification (0.0 to 1.0).")
     urgency_level: str = Field(..., description="detected urgency: 'low', 'medium', 'high', 'critical'.")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Literal, Any
 from .model_intent_agent import IntentClassification
 
@@ -7,6 +7,8 @@ class PlannerInput(BaseModel):
     available_agents: List[str] = Field(default_factory=list, description="List of currently available agents to plan with.")
 
 class WorkflowStep(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     step_id: str
     agent_name: str
     description: str
@@ -15,6 +17,8 @@ class WorkflowStep(BaseModel):
     parallel_group_id: Optional[str] = Field(None, description="If steps share a group ID, they can run in parallel.")
 
 class ExecutionPlan(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     plan_id: str
     strategy: Literal["serial", "parallel", "dynamic_dag"] = Field(..., description="The high-level execution strategy.")
     steps: List[WorkflowStep]
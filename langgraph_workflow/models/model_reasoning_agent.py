@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any
 from .model_retrieval_agent import ContextChunk
 
@@ -8,19 +8,27 @@ class ReasoningInput(BaseModel):
     problem_statement: str = Field(..., description="The core issue to analyze.")
 
 class RootCause(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     cause: str
     probability: float
     evidence: List[str] = Field(description="Quotes or references from context supporting this cause.")
 
 class ActionStep(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     step: str
     details: str
 
 class RecommendedSolution(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     immediate_actions: List[ActionStep] = Field(default_factory=list)
     long_term: List[ActionStep] = Field(default_factory=list)
 
 class ReasoningTrace(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     analysis_steps: List[str] = Field(description="Step-by-step chain of thought.")
     identified_patterns: List[str] = Field(default_factory=list, description="Correlations with historical data.")
     root_causes: List[RootCause]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 class RetrievalInput(BaseModel):
@@ -7,6 +7,8 @@ class RetrievalInput(BaseModel):
     top_k: int = Field(default=5, description="Number of chunks to retrieve.")
 
 class ContextChunk(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     chunk_id: str
     content: str = Field(..., description="The actual text content of the chunk.")
     source_document: str = Field(..., description="Filename or URI of the source.")
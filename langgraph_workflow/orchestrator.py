@@ -1,5 +1,10 @@
 # Orchestrator Agent for LangGraph Workflow
 
+import asyncio
+import os
+import sys
+import threading
+
 from workflow_definition import WORKFLOW_STEPS
 from agents import (
     interpreter_agent,
@@ -12,47 +17,108 @@ from agents import (
 )
 
 
+def read_line(prompt=""):
+    """
+    input() replacement that reads stdin one byte at a time straight from the file descriptor.
+    Nothing past the newline is buffered, and no lock on sys.stdin is held while blocked, so a
+    daemon thread left waiting in here does not stall interpreter shutdown.
+    """
+    print(prompt, end="", flush=True)
+    fd = sys.stdin.fileno()
+    line = bytearray()
+    while True:
+        ch = os.read(fd, 1)
+        if not ch:
+            if not line:
+                raise EOFError("EOF when reading a line")
+            break
+        if ch == b"\n":
+            break
+        line += ch
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+
 class Orchestrator:
+    CONFIRMATION_TIMEOUT = 60  # seconds to wait for the user before auto-cancelling
+
     def __init__(self, workflow_steps):
         self.workflow = workflow_steps
-        self.agents = {
-            "interpreter_agent": interpreter_agent.InterpreterAgent(),
-            # "content_generator": content_generator.ContentGeneratorWorker(),
-            # "schedule_calculator": schedule_calculator.ScheduleCalculatorWorker(),
-            # "plan_presenter": plan_presenter.PlanPresenterWorker(),
-            # "user_confirmation": user_confirmation.UserConfirmationWorker(),
-            # "api_caller": api_caller.APICallerWorker(),
-            # "progress_reporter": progress_reporter.ProgressReporterWorker()
-        }
+        # Fixed pipeline, split at the user confirmation gate; execute methods are bound once here
+        plan_stages = (
+            interpreter_agent.InterpreterAgent(),
+            # content_generator.ContentGeneratorWorker(),
+            # schedule_calculator.ScheduleCalculatorWorker(),
+            # plan_presenter.PlanPresenterWorker(),
+        )
+        execution_stages = (
+            # user_confirmation.UserConfirmationWorker(),
+            # api_caller.APICallerWorker(),
+            # progress_reporter.ProgressReporterWorker(),
+        )
+        self._plan_execs = tuple(stage.execute for stage in plan_stages)
+        self._execution_execs = tuple(stage.execute for stage in execution_stages)
         self.state = {}
 
-    def run(self, input_data):
+    async def _run_stages(self, execs):
+        # Each stage consumes the state produced by the previous one, so stages run in order.
+        # Agents are synchronous (LLM/API calls); run them on a worker thread so the event loop stays free
+        for execute in execs:
+            self.state = await asyncio.to_thread(execute, self.state)
+
+    @staticmethod
+    def _read_line(prompt):
+        # A blocking read cannot be interrupted, so it runs on a daemon thread rather than the default executor:
+        # when the confirmation times out the read is simply abandoned and asyncio.run() does not wait on it
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(answer, error):
+            if future.done():  # timed out and cancelled already
+                return
+            if error is None:
+                future.set_result(answer)
+            else:
+                future.set_exception(error)
+
+        def read():
+            answer, error = None, None
+            try:
+                answer = read_line(prompt)
+            except BaseException as e:  # EOFError / KeyboardInterrupt surface in the awaiting task
+                error = e
+            try:
+                loop.call_soon_threadsafe(resolve, answer, error)
+            except RuntimeError:  # loop already closed
+                pass
+
+        threading.Thread(target=read, daemon=True).start()
+        return future
+
+    async def _prompt_user(self, state):
+        print("\n--- PLAN SUMMARY ---")
+        print(state.get("plan_summary", "No summary available."))
+        answer = await self._read_line("\nDo you want to proceed? (Y/N): ")
+        return answer.strip().lower()
+
+    async def run(self, input_data):
         self.state = input_data
-        # Step 1: Interpreter agent
-        self.state = self.agents["interpreter_agent"].execute(self.state)
-        # Step 2: Content generator
-        self.state = self.agents["content_generator"].execute(self.state)
-        # Step 3: Schedule calculator
-        self.state = self.agents["schedule_calculator"].execute(self.state)
-        # Step 4: Plan presenter
-        self.state = self.agents["plan_presenter"].execute(self.state)
+        # Steps 1-4: interpreter, content generator, schedule calculator, plan presenter
+        await self._run_stages(self._plan_execs)
         # Present plan to user and ask for confirmation
-        print("\n--- PLAN SUMMARY ---")
-        print(self.state.get("plan_summary", "No summary available."))
-        confirm = input("\nDo you want to proceed? (Y/N): ").strip().lower()
+        try:
+            confirm = await asyncio.wait_for(self._prompt_user(self.state), timeout=self.CONFIRMATION_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"\nNo response within {self.CONFIRMATION_TIMEOUT}s. Workflow cancelled.")
+            return self.state
         if confirm != "y":
             print("Workflow cancelled by user.")
             return self.state
-        # Step 5: User confirmation
-        self.state = self.agents["user_confirmation"].execute(self.state)
-        # Step 6: API caller
-        self.state = self.agents["api_caller"].execute(self.state)
-        # Step 7: Progress reporter
-        self.state = self.agents["progress_reporter"].execute(self.state)
+        # Steps 5-7: user confirmation, API caller, progress reporter
+        await self._run_stages(self._execution_execs)
         return self.state
 
 if __name__ == "__main__":
     print("Enter your workflow request (e.g., product launch details, schedule, etc.):")
-    user_input = input()
+    user_input = read_line()
     orchestrator = Orchestrator(WORKFLOW_STEPS)
-    orchestrator.run({"user_input": user_input})
+    asyncio.run(orchestrator.run({"user_input": user_input}))
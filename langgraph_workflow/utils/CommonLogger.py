@@ -1,25 +1,100 @@
+import atexit
+import logging
 import os
+import queue
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class _PathDispatchHandler(logging.Handler):
+    """
+    Routes each record to a RotatingFileHandler for the record's `log_path`.
+    Runs on the QueueListener thread, so file handlers are opened lazily and reused; only the
+    most recently used `max_open` stay open, since callers such as the orchestrator log to a
+    fresh timestamped path per instance.
+    """
+
+    def __init__(self, max_bytes, backup_count, max_open=32):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_open = max_open
+        self._handlers = OrderedDict()
+
+    def emit(self, record):
+        try:
+            log_path = record.log_path
+            handler = self._handlers.get(log_path)
+            if handler is not None:
+                self._handlers.move_to_end(log_path)
+            else:
+                log_dir = os.path.dirname(log_path)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                handler = RotatingFileHandler(
+                    log_path,
+                    maxBytes=self.max_bytes,
+                    backupCount=self.backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._handlers[log_path] = handler
+                if len(self._handlers) > self.max_open:
+                    self._handlers.popitem(last=False)[1].close()
+            handler.handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers.clear()
+        super().close()
+
 
 class CommonLogger:
+    MAX_BYTES = 10 * 1024 * 1024
+    BACKUP_COUNT = 5
+    MAX_OPEN_FILES = 32
+
+    _logger = None
+    _listener = None
+    _init_lock = threading.Lock()
+
+    @classmethod
+    def _get_logger(cls):
+        """
+        Lazily configures the shared "workflow" logger: callers only enqueue records,
+        and a background QueueListener drains them into buffered per-path file handlers.
+        """
+        if cls._logger is None:
+            with cls._init_lock:
+                if cls._logger is None:
+                    log_queue = queue.Queue(-1)
+                    listener = QueueListener(log_queue, _PathDispatchHandler(cls.MAX_BYTES, cls.BACKUP_COUNT, cls.MAX_OPEN_FILES))
+                    listener.start()
+                    atexit.register(listener.stop)
+
+                    logger = logging.getLogger("workflow")
+                    logger.setLevel(logging.INFO)
+                    logger.propagate = False
+                    logger.addHandler(QueueHandler(log_queue))
+                    cls._listener = listener
+                    cls._logger = logger
+        return cls._logger
+
     @staticmethod
     def WriteLog(log_path, message):
         """
         Appends the message to the log file at log_path, creating the file if it does not exist.
+        The write happens on a background thread; pending messages are flushed at interpreter exit.
         Args:
             log_path (str): Relative or absolute path to the log file.
             message (str): The message to write (will append a newline).
         """
         try:
-            # Debugging: Print log path and message
-            print(f"[DEBUG] Writing to log file: {log_path}")
-            print(f"[DEBUG] Message: {message}")
-
-            # Ensure the directory exists
-            log_dir = os.path.dirname(log_path)
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(message + "\n")
+            CommonLogger._get_logger().info(message, extra={"log_path": log_path})
         except Exception as e:
             print(f"[ERROR] Failed to write to log file: {e}")
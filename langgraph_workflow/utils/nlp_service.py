@@ -1,7 +1,13 @@
+import hashlib
 import json
+import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from llm_client import LLMClient
 from models.model_intent_agent import IntentClassification
@@ -12,6 +18,104 @@ except Exception:
     # fallback when running from repo root
     from toon_converter import JsonToToonConverter
 
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type either way
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Outermost {...} span in a reply that wraps its JSON in prose or code fences
+_JSON_BLOCK = re.compile(r"\{[\s\S]*\}")
+
+_log = logging.getLogger(__name__)
+
+# Compact JSON at or below this many characters is sent as-is; TOON only pays off on larger payloads
+_TOON_MIN_CHARS = 512
+
+# Process-wide LRU of raw LLM replies for deterministic (temperature 0) prompts,
+# keyed by (model, sha256(prompt), max_tokens, temperature)
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str, int, float], str]" = OrderedDict()
+_RESPONSE_CACHE_MAXSIZE = 4096
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+# SLA risk for urgent requests regardless of the SLA window
+_URGENCY_RISK_FLOOR = {"critical": 0.95, "high": 0.8}
+# (max SLA hours, risk) pairs in ascending order of hours; longer windows fall back to _DEFAULT_SLA_RISK
+_SLA_HOURS_RISK = ((2, 0.7), (4, 0.6), (8, 0.4))
+_DEFAULT_SLA_RISK = 0.2
+
+
+@dataclass(frozen=True)
+class _Policies:
+    """Parsed policy files plus the lookup structures derived from them."""
+    intent_config: Dict[str, Any]
+    safety_policy: Dict[str, Any]
+    safety_regexes: Tuple["re.Pattern[str]", ...]
+    intent_keywords: Tuple[Tuple[str, "re.Pattern[str]"], ...]
+    load_errors: Tuple[str, ...]
+
+
+def _read_policy(policies_dir: str, filename: str, errors: List[str]) -> Dict[str, Any]:
+    path = os.path.join(policies_dir, filename)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        errors.append(f"Failed to load {filename}: {e}")
+        return {}
+
+
+@lru_cache(maxsize=8)
+def _load_policies(policies_dir: str) -> _Policies:
+    """Load and preprocess the policy files once per directory (policies are treated as read-only)."""
+    errors: List[str] = []
+    intent_config = _read_policy(policies_dir, "intent_config.json", errors)
+    safety_policy = _read_policy(policies_dir, "safety_policy.json", errors)
+
+    combinable, separate = [], []
+    for pattern in safety_policy.get("regex_patterns", []):
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            errors.append(f"Invalid regex pattern '{pattern}': {e}")
+            continue
+        # Joining renumbers capture groups (a backreference would then point into another pattern)
+        # and a global inline flag is invalid once wrapped, so such patterns are matched on their own
+        if not compiled.groups:
+            try:
+                re.compile(f"(?:{pattern})")
+                combinable.append(pattern)
+                continue
+            except re.error:
+                pass
+        separate.append(compiled)
+    # One alternation for the rest so safety_check scans the text once instead of once per pattern
+    if combinable:
+        separate.insert(0, re.compile("|".join(f"(?:{p})" for p in combinable), re.IGNORECASE))
+
+    # One literal alternation per intent (in priority order), matched against the lowercased query
+    keywords = tuple(
+        (intent, re.compile("|".join(re.escape(word.lower()) for word in words)))
+        for intent, words in intent_config.get("heuristic_keywords", {}).items()
+        if words
+    )
+    return _Policies(
+        intent_config=intent_config,
+        safety_policy=safety_policy,
+        safety_regexes=tuple(separate),
+        intent_keywords=keywords,
+        load_errors=tuple(errors),
+    )
+
 
 class NLPService:
     """
@@ -23,35 +127,83 @@ class NLPService:
         self.debug = debug
         self.llm = LLMClient(agent_type=agent_type, debug=debug)
         self.policies_dir = policies_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), "policies")
-        self.intent_config = self._load_json("intent_config.json")
-        self.safety_policy = self._load_json("safety_policy.json")
+        policies = _load_policies(os.path.abspath(self.policies_dir))
+        for error in policies.load_errors:
+            _log.debug("[NLPService] %s", error)
+        self.intent_config = policies.intent_config
+        self.safety_policy = policies.safety_policy
+        self._safety_regexes = policies.safety_regexes
+        self._intent_keywords = policies.intent_keywords
+        self._sla_thresholds = self.intent_config.get("sla_thresholds_hours", {})
+        self._default_sla_hours = self._sla_thresholds.get("default", 8)
         # No static mapping file needed; we generate on fly or rely on context
         self.toon_mapping = None
+        # Categories and definitions are static policy data, so the encoded context and prompt prefix are built once;
+        # analyze_intent only appends the per-query hint and text
+        base_context = {
+            "categories": self.intent_config.get("categories", []),
+            "definitions": self.intent_config.get("category_definitions", {}),
+        }
+        context_label, context = self._maybe_toon(base_context)
+        encoding_note = (
+            "The context is provided in a compact TOON encoding below. "
+            if context_label == "TOON_CONTEXT" else "The context is provided as JSON below. "
+        )
+        self._intent_prompt_prefix = (
+            "You are an intent classifier for a support system. "
+            f"{encoding_note}You MAY use it to answer. "
+            "Prefer returning structured JSON, but if you return TOON, it will be decoded.\n\n"
+            f"{context_label}: {context}\n"
+        )
 
-    def _load_json(self, filename: str) -> Dict[str, Any]:
-        path = os.path.join(self.policies_dir, filename)
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            if self.debug:
-                print(f"[NLPService] Failed to load {filename}: {e}")
-            return {}
+    def _maybe_toon(self, payload: Any) -> Tuple[str, str]:
+        """
+        Returns (prompt label, encoded payload). Small payloads stay compact JSON, since TOON's
+        key rewriting saves little there; larger ones are TOON-encoded.
+        """
+        as_json = _dumps(payload)
+        if len(as_json) <= _TOON_MIN_CHARS:
+            return "JSON_CONTEXT", as_json
+        return "TOON_CONTEXT", JsonToToonConverter.encode(payload, mapping=self.toon_mapping)
 
     def _extract_json(self, text: str) -> Dict[str, Any]:
         try:
-            return json.loads(text)
+            return _loads(text)
         except json.JSONDecodeError:
-            match = re.search(r"\{[\s\S]*\}", text)
+            match = _JSON_BLOCK.search(text)
             if match:
                 try:
-                    return json.loads(match.group(0))
+                    return _loads(match.group(0))
                 except json.JSONDecodeError:
                     return {}
         return {}
 
-    def _call_llm_json(self, prompt: str, max_tokens: int = 512, temperature: float = 0.0) -> Dict[str, Any]:
+    def _generate(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """
+        Call the LLM, serving repeated deterministic prompts (temperature 0) from the
+        process-wide response cache. Sampled prompts always go to the LLM.
+        """
+        if temperature != 0:
+            return self.llm.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+
+        key = (self.llm.model, hashlib.sha256(prompt.encode("utf-8")).hexdigest(), max_tokens, temperature)
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(key)
+        if cached is not None:
+            _log.debug("[NLPService] LLM response cache hit (0 tokens used)")
+            return cached
+
         response = self.llm.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = response
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+        return response
+
+    def _call_llm_json(self, prompt: str, max_tokens: int = 512, temperature: float = 0.0) -> Dict[str, Any]:
+        response = self._generate(prompt, max_tokens, temperature)
         return self._extract_json(response)
 
     def _call_llm_toon_aware(self, prompt: str, max_tokens: int = 512, temperature: float = 0.0) -> Dict[str, Any]:
@@ -59,7 +211,7 @@ class NLPService:
         Call LLM and accept either JSON or TOON responses. If JSON parse fails,
         attempt to decode as TOON using JsonToToonConverter and the loaded mapping.
         """
-        response = self.llm.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+        response = self._generate(prompt, max_tokens, temperature)
         # Try JSON first
         parsed = self._extract_json(response)
         if parsed:
@@ -75,39 +227,30 @@ class NLPService:
         return {}
 
     def _keyword_intent_hint(self, text: str) -> Optional[str]:
-        keywords = self.intent_config.get("heuristic_keywords", {})
         lowered = text.lower()
-        for intent, words in keywords.items():
-            if any(word.lower() in lowered for word in words):
+        for intent, pattern in self._intent_keywords:
+            if pattern.search(lowered):
                 return intent
         return None
 
     def _calculate_sla_risk(self, primary_intent: str, urgency: str) -> float:
-        thresholds = self.intent_config.get("sla_thresholds_hours", {})
-        hours = thresholds.get(primary_intent, thresholds.get("default", 8))
-
-        if urgency == "critical":
-            return 0.95
-        if urgency == "high":
-            return 0.8
-        if hours <= 2:
-            return 0.7
-        if hours <= 4:
-            return 0.6
-        if hours <= 8:
-            return 0.4
-        return 0.2
+        if isinstance(urgency, str) and urgency in _URGENCY_RISK_FLOOR:
+            return _URGENCY_RISK_FLOOR[urgency]
+
+        hours = self._sla_thresholds.get(primary_intent, self._default_sla_hours)
+        for max_hours, risk in _SLA_HOURS_RISK:
+            if hours <= max_hours:
+                return risk
+        return _DEFAULT_SLA_RISK
 
     def safety_check(self, text: str) -> Dict[str, Any]:
-        patterns = self.safety_policy.get("regex_patterns", [])
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return {
-                    "is_safe": False,
-                    "severity": "high",
-                    "reason": "Matched disallowed regex pattern",
-                    "action": self.safety_policy.get("actions", {}).get("high_severity", "block_and_escalate")
-                }
+        if any(regex.search(text) for regex in self._safety_regexes):
+            return {
+                "is_safe": False,
+                "severity": "high",
+                "reason": "Matched disallowed regex pattern",
+                "action": self.safety_policy.get("actions", {}).get("high_severity", "block_and_escalate")
+            }
 
         guidelines = self.safety_policy.get("semantic_guidelines", {})
         forbidden = self.safety_policy.get("forbidden_topics", [])
@@ -134,23 +277,10 @@ class NLPService:
         }
 
     def analyze_intent(self, text: str) -> IntentClassification:
-        categories = self.intent_config.get("categories", [])
-        definitions = self.intent_config.get("category_definitions", {})
         hint = self._keyword_intent_hint(text)
-        # Build a compact TOON context payload to reduce token usage when communicating with the LLM.
-        context_payload = {
-            "categories": categories,
-            "definitions": definitions,
-            "hint": hint
-        }
-
-        toon_context = JsonToToonConverter.encode(context_payload, mapping=self.toon_mapping)
-
         prompt = (
-            "You are an intent classifier for a support system. "
-            "The context is provided in a compact TOON encoding below. You MAY use it to answer. "
-            "Prefer returning structured JSON, but if you return TOON, it will be decoded.\n\n"
-            f"TOON_CONTEXT: {toon_context}\n\n"
+            f"{self._intent_prompt_prefix}"
+            f"HINT: {hint or 'none'}\n\n"
             f"Query: {text}\n\n"
             "Return JSON with keys: primary_intent (string), secondary_intents (array), "
             "urgency_level (low|medium|high|critical), confidence_score (0-1), reasoning (string)."
@@ -165,8 +295,11 @@ class NLPService:
 
         sla_risk = self._calculate_sla_risk(primary_intent, urgency)
 
-        try:
-            return IntentClassification(
+        # The fields are type-checked here, so the model is built without a second validation pass
+        if (isinstance(primary_intent, str) and isinstance(urgency, str) and isinstance(secondary, list)
+                and all(isinstance(i, str) for i in secondary)
+                and (reasoning is None or isinstance(reasoning, str))):
+            return IntentClassification.model_construct(
                 primary_intent=primary_intent,
                 confidence_score=confidence,
                 urgency_level=urgency,
@@ -174,8 +307,8 @@ class NLPService:
                 secondary_intents=secondary,
                 reasoning=reasoning
             )
-        except Exception:
-            return IntentClassification(
+        else:
+            return IntentClassification.model_construct(
                 primary_intent=hint or "faq",
                 confidence_score=0.3,
                 urgency_level="low",
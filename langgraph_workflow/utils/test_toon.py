@@ -28,3 +28,70 @@ print("DECODED:\n", decoded)
 assert decoded["primary_intent"] == sample["primary_intent"]
 assert decoded["details"]["error"] == sample["details"]["error"]
 print("Roundtrip OK")
+
+# Auto-generated short names must not collide with keys that are already short
+for payload in (
+    {"input_data": {"x": 1}, "id": 5},
+    {"primary_intent": "billing", "pi": 3.14},
+    {"user_id": "u-1", "ui": "dark"},
+    {"a_b": 1, "ab": 2},
+):
+    for deterministic in (False, True):
+        auto = JsonToToonConverter._generate_auto_mapping(payload, deterministic=deterministic)
+        assert len(set(auto.values())) == len(auto), auto
+        encoded = JsonToToonConverter.encode(payload, mapping=auto)
+        assert JsonToToonConverter.decode(encoded, mapping=auto) == payload, (payload, encoded)
+print("Auto-mapping collisions OK")
+
+# Strings with escapes, backslashes and TOON delimiters survive a roundtrip
+tricky = {
+    "quote": 'say "hi"',
+    "backslash": "C:\\temp\\new",
+    "trailing": "ends with \\",
+    "escaped_quote": '\\"',
+    "delimiters": "a;b,c)d]e=f(g[h",
+    "empty": "",
+    "list": ["\\n", '"', "\\\\"],
+}
+encoded = JsonToToonConverter.encode(tricky, mapping=mapping)
+assert JsonToToonConverter.decode(encoded, mapping=mapping) == tricky, encoded
+print("Escapes OK")
+
+# Empty objects and arrays, nested inside containers
+empties = {"obj": {}, "arr": [], "mixed": [{}, [], {"inner": []}, [[]]], "deep": {"a": {"b": {}}}}
+auto = JsonToToonConverter._generate_auto_mapping(empties)
+encoded = JsonToToonConverter.encode(empties, mapping=auto)
+assert JsonToToonConverter.decode(encoded, mapping=auto) == empties, encoded
+assert JsonToToonConverter.decode("()") == {}
+assert JsonToToonConverter.decode("[]") == []
+print("Empty containers OK")
+
+# Deep nesting: the codec is iterative, so depth is not bounded by the recursion limit
+deep = leaf = {}
+for depth in range(3000):
+    child = {"level": depth, "children": [{}]}
+    leaf["next"] = child
+    leaf = child["children"][0]
+auto = JsonToToonConverter._generate_auto_mapping(deep)
+encoded = JsonToToonConverter.encode(deep, mapping=auto)
+decoded = JsonToToonConverter.decode(encoded, mapping=auto)
+# compare via re-encoding: == itself would recurse past the limit
+assert JsonToToonConverter.encode(decoded, mapping=auto) == encoded
+levels = 0
+while decoded:
+    decoded = decoded["next"]["children"][0]
+    levels += 1
+assert levels == 3000
+print("Deep nesting OK")
+
+# Malformed arrays are rejected (and not valid JSON either) instead of hanging the decoder
+for malformed in ("[1;2]", "[1)2]", "[(a=1);]", "(a=[1,2;3])"):
+    assert JsonToToonConverter.decode(malformed) is None, malformed
+print("Malformed input OK")
+
+# Raw UTF-8 bytes are accepted; invalid UTF-8 is treated like any other undecodable input
+encoded = JsonToToonConverter.encode(sample, mapping=mapping)
+assert JsonToToonConverter.decode(encoded.encode("utf-8"), mapping=mapping) == sample
+assert JsonToToonConverter.decode('(pi="café")'.encode("utf-8"), mapping=mapping) == {"primary_intent": "café"}
+assert JsonToToonConverter.decode(b"\xff(pi=1)", mapping=mapping) is None
+print("Bytes input OK")
@@ -1,211 +1,328 @@
 import re
 import json
-from typing import Any, Dict, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Decoder token patterns, matched in place with an explicit start position
+# Numbers first (group 1 marks a fraction), then keywords (group 2); see _decode for the lastindex routing
+_NUM_RE = re.compile(r"-?\d+(\.\d+)?|(true|false|null)")
+_LITERALS = {"true": True, "false": False, "null": None}
+_FALLBACK_RE = re.compile(r"[^,;\)\]]+")
+_KEY_RE = re.compile(r"([A-Za-z0-9_\-]+)=")
+_WS_RE = re.compile(r"\s*")
+# Characters _WS_RE skips (every str.isspace() character lies below U+3001); a set lookup on the next
+# character lets compact input, which has no whitespace, skip the regex call entirely
+_WHITESPACE = frozenset(c for c in map(chr, range(0x3001)) if c.isspace())
+
+# Encoder escapes for string values: one str.translate pass instead of chained replace() calls
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# Sentinels for the iterative encoder/decoder: end of a container's members / a container was just opened
+_END = object()
+_OPEN = object()
+
+
+@lru_cache(maxsize=4096)
+def _key_initials(key: str) -> str:
+    """Acronym used as the base short name: "primary_intent" -> "pi"."""
+    return "".join(p[0] for p in key.split('_') if p).lower()
+
+
+def _scan_keys(obj: Any, deterministic: bool = False) -> Tuple[str, ...]:
+    """
+    All dict keys found anywhere in obj (the cache key for _mapping_for_keys), in the order the
+    scan meets them; deterministic=True sorts them so key order in the payload does not matter.
+    """
+    # dict as an ordered set (the values it picks up are ignored)
+    keys = {}
+    # Explicit stack instead of recursion: no frame per nested container and no recursion limit
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            keys.update(o)
+            stack.extend(o.values())
+        elif isinstance(o, list):
+            stack.extend(o)
+    return tuple(sorted(keys)) if deterministic else tuple(keys)
+
+
+@lru_cache(maxsize=256)
+def _mapping_for_keys(keys: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Short-name mapping for a key tuple; when two keys share initials the earlier one gets the
+    unnumbered short name. Payloads of the same shape share one cached
+    mapping, so the returned dict must be treated as read-only.
+    """
+    # Simple generation strategy:
+    # "primary_intent" -> "pi"
+    # "user_input" -> "ui"
+    # Keys of two characters or less are kept as-is, so reserve them all before generating
+    # anything: otherwise "input_data" could take "id" ahead of a real "id" key.
+    mapping = {key: key for key in keys if len(key) <= 2}
+    used_values = set(mapping)
+
+    for key in keys:
+        if len(key) <= 2:
+            continue
+
+        base = _key_initials(key)
+
+        candidate = base
+        counter = 1
+        while candidate in used_values:
+            candidate = f"{base}{counter}"
+            counter += 1
+
+        mapping[key] = candidate
+        used_values.add(candidate)
+
+    return mapping
+
+
+def _decode(s: str, rev_map: Dict[str, str]) -> Any:
+    """
+    Iterative TOON parser. Open containers are kept on an explicit stack as [container, slot], where
+    slot is the pending (long) key of an object or the start offset of the current array item.
+    rev_map (short -> long key) is extended with interned unmapped keys, so pass a private copy.
+
+    Preconditions (not re-checked here): s is already stripped, so skipping whitespace never runs off
+    the end inside a container; and each branch is entered only from the dispatch on s[idx], so the
+    opening '(' / '[' / '"' is known without asserting it.
+    """
+    length = len(s)
+    # Hot-loop methods and constants bound once to locals
+    find = s.find
+    ws_match = _WS_RE.match
+    num_match = _NUM_RE.match
+    key_match = _KEY_RE.match
+    rev_get = rev_map.get
+    whitespace = _WHITESPACE
+    stack = []
+    idx = 0
+    while True:
+        # Parse one value at idx; "(" and "[" only open a container, whose members are read below
+        if idx < length and s[idx] in whitespace:
+            idx = ws_match(s, idx).end()
+        value = _OPEN
+        if idx >= length:
+            value = None
+        else:
+            ch = s[idx]
+            # Branches are ordered by how often each value kind appears in agent payloads
+            if ch == '"':
+                pos = idx + 1
+                # an unterminated string runs to the end of input
+                quote = find('"', pos)
+                if quote == -1:
+                    quote = length
+                backslash = find('\\', pos, quote)
+                if backslash == -1:
+                    value = s[pos:quote]
+                else:
+                    # Escapes present: copy the clean spans between them; each backslash escapes the next character
+                    buf = []
+                    while backslash != -1:
+                        buf.append(s[pos:backslash])
+                        if backslash + 1 == length:
+                            # trailing lone backslash in truncated input is kept literally
+                            buf.append('\\')
+                            pos = length
+                            break
+                        buf.append(s[backslash + 1])
+                        pos = backslash + 2
+                        if pos > quote:
+                            # the quote found earlier was escaped; look for the real closing quote
+                            quote = find('"', pos)
+                            if quote == -1:
+                                quote = length
+                        backslash = find('\\', pos, quote)
+                    buf.append(s[pos:quote])
+                    value = ''.join(buf)
+                idx = quote + 1
+            elif ch == '(':
+                idx += 1
+                stack.append([{}, None])
+            elif ch == '[':
+                idx += 1
+                stack.append([[], None])
+            else:
+                # parse true/false/null or number
+                match = num_match(s, idx)
+                if match:
+                    idx = match.end()
+                    # lastindex routes without re-inspecting the token: no group -> integer (the common case)
+                    kind = match.lastindex
+                    if kind is None:
+                        value = int(match.group())
+                    elif kind == 1:
+                        value = float(match.group())
+                    else:
+                        value = _LITERALS[match.group()]
+                else:
+                    # fallback: try to consume until delimiter
+                    m = _FALLBACK_RE.match(s, idx)
+                    if m:
+                        value = m.group(0).strip()
+                        idx = m.end()
+                    else:
+                        value = None
+
+        while True:
+            if value is not _OPEN:
+                # Attach the finished value to the innermost open container
+                if not stack:
+                    return value
+                frame = stack[-1]
+                container = frame[0]
+                if idx < length and s[idx] in whitespace:
+                    idx = ws_match(s, idx).end()
+                if type(container) is dict:
+                    container[frame[1]] = value
+                    if idx < length and s[idx] == ';':
+                        idx += 1
+                    elif idx < length and s[idx] == ')':
+                        idx += 1
+                        value = stack.pop()[0]
+                        continue
+                else:
+                    container.append(value)
+                    if idx < length and s[idx] == ',':
+                        idx += 1
+                    elif idx == frame[1]:
+                        # stray ";" or ")" inside an array: no progress is possible
+                        raise ValueError(f"Unexpected {s[idx]!r} at offset {idx}")
+
+            # Find the next member of the innermost open container, closing it when there is none
+            frame = stack[-1]
+            container = frame[0]
+            if idx < length:
+                if s[idx] in whitespace:
+                    idx = ws_match(s, idx).end()
+                if type(container) is dict:
+                    m = key_match(s, idx)
+                    if m:
+                        key = m.group(1)
+                        long_key = rev_get(key)
+                        if long_key is None:
+                            # Unmapped keys repeat across list elements: intern once and reuse the shared
+                            # string for the rest of the document
+                            long_key = rev_map[key] = sys.intern(key)
+                        frame[1] = long_key
+                        idx = m.end()
+                        break
+                    # no key found: the object ends here (an explicit ")" is consumed)
+                    if idx < length and s[idx] == ')':
+                        idx += 1
+                elif idx < length and s[idx] == ']':
+                    idx += 1
+                else:
+                    frame[1] = idx
+                    break
+            value = stack.pop()[0]
+
+
+def _generate_auto_mapping(obj: Any, deterministic: bool = False) -> Dict[str, str]:
+    """
+    Scan keys at every nesting level and generate mapping. By default short names follow the order
+    keys appear in obj; deterministic=True sorts first, so payloads with the same keys in any order
+    get the same mapping (at the cost of a sort per call).
+    """
+    # Copy so callers may modify their mapping without touching the shared cached one
+    return dict(_mapping_for_keys(_scan_keys(obj, deterministic)))
+
+
+def _escape_str(s: str) -> str:
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _encode(obj: Any, mapping: Dict[str, str]) -> str:
+    # Iterative walk: open containers live on an explicit stack as [member iterator, is_dict, separator],
+    # and tokens are appended to one shared buffer that is joined once
+    out = []
+    # Hot-loop methods bound once to locals
+    append = out.append
+    map_get = mapping.get
+    escape_table = _ESCAPE_TABLE
+    stack = []
+    value = obj
+    while True:
+        if isinstance(value, dict):
+            append("(")
+            stack.append([iter(value.items()), True, ""])
+        elif isinstance(value, list):
+            append("[")
+            stack.append([iter(value), False, ""])
+        elif isinstance(value, str):
+            append('"')
+            append(value.translate(escape_table))
+            append('"')
+        elif isinstance(value, bool):
+            append("true" if value else "false")
+        elif value is None:
+            append("null")
+        else:
+            append(str(value))
+
+        # Move to the next member of the innermost open container, closing exhausted ones
+        while stack:
+            frame = stack[-1]
+            member = next(frame[0], _END)
+            if member is _END:
+                stack.pop()
+                append(")" if frame[1] else "]")
+                continue
+            if frame[1]:
+                key, value = member
+                append(f"{frame[2]}{map_get(key, key)}=")
+                frame[2] = ";"
+            else:
+                value = member
+                append(frame[2])
+                frame[2] = ","
+            break
+        else:
+            return "".join(out)
+
 
 class JsonToToonConverter:
     """
     Simple, reversible JSON <-> TOON converter.
     Includes auto-generation of mapping if none provided.
+    The codec itself is plain module-level functions; this class is the public entry point.
     """
-    
-    @staticmethod
-    def _generate_auto_mapping(obj: Any) -> Dict[str, str]:
-        """Scan keys recursively and generate mapping."""
-        keys = set()
-        def _scan(o):
-            if isinstance(o, dict):
-                for k, v in o.items():
-                    keys.add(k)
-                    _scan(v)
-            elif isinstance(o, list):
-                for i in o:
-                    _scan(i)
-        _scan(obj)
-        
-        # Simple generation strategy: 
-        # "primary_intent" -> "pi"
-        # "user_input" -> "ui"
-        mapping = {}
-        used_values = set()
-        
-        for key in sorted(keys):
-            if len(key) <= 2:
-                mapping[key] = key
-                used_values.add(key)
-                continue
-                
-            parts = key.split('_')
-            base = "".join(p[0] for p in parts if p).lower()
-            
-            candidate = base
-            counter = 1
-            while candidate in used_values:
-                candidate = f"{base}{counter}"
-                counter += 1
-            
-            mapping[key] = candidate
-            used_values.add(candidate)
-            
-        return mapping
-
-    @staticmethod
-    def _escape_str(s: str) -> str:
-        return s.replace('\\', '\\\\').replace('"', '\\"')
-
-    @staticmethod
-    def _unescape_str(s: str) -> str:
-        return s.replace('\\"', '"').replace('\\\\', '\\')
+
+    _generate_auto_mapping = staticmethod(_generate_auto_mapping)
+    _escape_str = staticmethod(_escape_str)
 
     @classmethod
     def encode(cls, obj: Any, mapping: Optional[Dict[str, str]] = None) -> str:
         # If no mapping provided, generate one on the fly (NOTE: Decoder needs same mapping!)
         # In practice, either pass a shared mapping or include mapping in payload (overhead).
         # For now, we assume user provides mapping or we generate one but warn it's not stateless.
-        mapping = mapping or cls._generate_auto_mapping(obj)
-
-        def _enc(x):
-            if isinstance(x, dict):
-                parts = []
-                for k, v in x.items():
-                    shortk = mapping.get(k, k)
-                    parts.append(f"{shortk}={_enc(v)}")
-                return f"({';'.join(parts)})"
-            elif isinstance(x, list):
-                return "[" + ",".join(_enc(i) for i in x) + "]"
-            elif isinstance(x, str):
-                return '"' + cls._escape_str(x) + '"'
-            elif isinstance(x, bool):
-                return "true" if x else "false"
-            elif x is None:
-                return "null"
-            else:
-                return str(x)
-
-        return _enc(obj)
+        return _encode(obj, mapping or _mapping_for_keys(_scan_keys(obj)))
 
     @classmethod
-    def decode(cls, toon: str, mapping: Optional[Dict[str, str]] = None) -> Any:
+    def decode(cls, toon: Union[str, bytes], mapping: Optional[Dict[str, str]] = None) -> Any:
         mapping = mapping or {}
         # build reverse mapping
         rev_map = {v: k for k, v in mapping.items()}
-
-        s = toon.strip()
-        idx = 0
-        length = len(s)
-
-        def _peek():
-            return s[idx] if idx < length else None
-
-        def _consume_whitespace():
-            nonlocal idx
-            while idx < length and s[idx].isspace():
-                idx += 1
-
-        def _parse_value():
-            nonlocal idx
-            _consume_whitespace()
-            if idx >= length:
-                return None
-            ch = s[idx]
-            if ch == '(':
-                return _parse_object()
-            if ch == '[':
-                return _parse_array()
-            if ch == '"':
-                return _parse_string()
-            # parse true/false/null or number
-            match = re.match(r"(true|false|null|-?\d+(?:\.\d+)?)", s[idx:])
-            if match:
-                token = match.group(1)
-                idx += len(token)
-                if token == 'true':
-                    return True
-                if token == 'false':
-                    return False
-                if token == 'null':
-                    return None
-                if '.' in token:
-                    return float(token)
-                return int(token)
-            # fallback: try to consume until delimiter
-            m = re.match(r"[^,;\)\]]+", s[idx:])
-            if m:
-                token = m.group(0).strip()
-                idx += len(m.group(0))
-                return token
-            return None
-
-        def _parse_string():
-            nonlocal idx
-            assert s[idx] == '"'
-            idx += 1
-            buf = []
-            while idx < length:
-                ch = s[idx]
-                if ch == '\\':
-                    if idx + 1 < length:
-                        nxt = s[idx + 1]
-                        buf.append(nxt)
-                        idx += 2
-                        continue
-                if ch == '"':
-                    idx += 1
-                    break
-                buf.append(ch)
-                idx += 1
-            return cls._unescape_str(''.join(buf))
-
-        def _parse_array():
-            nonlocal idx
-            assert s[idx] == '['
-            idx += 1
-            arr = []
-            while idx < length:
-                _consume_whitespace()
-                if idx < length and s[idx] == ']':
-                    idx += 1
-                    break
-                val = _parse_value()
-                arr.append(val)
-                _consume_whitespace()
-                if idx < length and s[idx] == ',':
-                    idx += 1
-                    continue
-            return arr
-
-        def _parse_object():
-            nonlocal idx
-            assert s[idx] == '('
-            idx += 1
-            obj = {}
-            while idx < length:
-                _consume_whitespace()
-                # read key
-                m = re.match(r"([A-Za-z0-9_\-]+)=", s[idx:])
-                if not m:
-                    # no key found, skip
-                    break
-                key = m.group(1)
-                idx += len(m.group(0))
-                val = _parse_value()
-                long_key = rev_map.get(key, key)
-                obj[long_key] = val
-                _consume_whitespace()
-                if idx < length and s[idx] == ';':
-                    idx += 1
-                    continue
-                if idx < length and s[idx] == ')':
-                    idx += 1
-                    break
-            return obj
-
-        # Attempt to parse top-level
         try:
-            val = _parse_value()
-            return val
+            if isinstance(toon, (bytes, bytearray)):
+                # raw UTF-8 (e.g. an HTTP body) is decoded once here; invalid bytes take the JSON fallback below
+                toon = toon.decode("utf-8")
+            return _decode(toon.strip(), rev_map)
         except Exception:
             # fallback: try JSON
             try:
-                return json.loads(toon)
+                return _json_loads(toon)
             except Exception:
                 return None